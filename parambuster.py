@@ -1,304 +1,445 @@
-import requests
-from bs4 import BeautifulSoup, Comment
-from urllib.parse import urlparse, parse_qs, urljoin
-import re
-import sys
-
-class WebParameterFinder:
-    """
-    A class to find public and hidden parameters in a web application's HTML source,
-    including query string, form, JavaScript, comments, and potential path parameters.
-    """
-
-    def __init__(self, url):
-        self.url = url
-        self.html_content = None
-        self.found_parameters = {
-            "URL Query Parameters": set(),
-            "Potential Path/Route Parameters": set(),
-            "Form Parameters (Visible)": set(),
-            "Form Parameters (Hidden)": set(),
-            "JavaScript-like Parameters": set(),
-            "Comment Parameters": set(),
-        }
-        self.processed_urls = set() # To avoid redundant processing of URLs
-
-    def fetch_page(self):
-        """
-        Fetches the HTML content of the given URL.
-        """
-        try:
-            print(f"[*] Fetching page: {self.url}")
-            response = requests.get(self.url, timeout=10)
-            response.raise_for_status()  # Raise an HTTPError for bad responses (4xx or 5xx)
-            self.html_content = response.text
-            print("[*] Page fetched successfully.")
-        except requests.exceptions.RequestException as e:
-            print(f"[-] Error fetching page {self.url}: {e}")
-            sys.exit(1) # Exit if we can't fetch the page
-
-    def extract_url_query_parameters(self):
-        """
-        Extracts parameters directly from the URL's query string.
-        """
-        parsed_url = urlparse(self.url)
-        query_params = parse_qs(parsed_url.query)
-        for param_name in query_params.keys():
-            self.found_parameters["URL Query Parameters"].add(param_name)
-        if query_params:
-            print(f"[+] Found URL Query Parameters: {list(query_params.keys())}")
-        else:
-            print("[-] No URL Query Parameters found in the initial URL.")
-
-    def extract_potential_path_parameters(self):
-        """
-        Extracts potential path/route parameters by analyzing URLs found in the HTML.
-        This uses heuristics to identify dynamic segments or explicit placeholders.
-        """
-        if not self.html_content:
-            return
-
-        soup = BeautifulSoup(self.html_content, 'html.parser')
-        
-        # Collect all potential URLs from href, action, and script tags
-        urls_to_analyze = set()
-
-        # From <a> tags
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            urls_to_analyze.add(urljoin(self.url, href)) # Resolve relative URLs
-
-        # From <form> tags
-        for form_tag in soup.find_all('form', action=True):
-            action = form_tag['action']
-            urls_to_analyze.add(urljoin(self.url, action)) # Resolve relative URLs
-
-        # From <script> tags (look for URL-like strings)
-        script_content = "\n".join([script.string if script.string else '' for script in soup.find_all('script')])
-        # A more general regex for URLs in scripts, including relative paths
-        # This is a broad net and might catch non-URL strings.
-        js_url_pattern = re.compile(r'(?:["\'])(/?[a-zA-Z0-9_\-./]+)(?:["\'])')
-        for match in js_url_pattern.finditer(script_content):
-            found_url = match.group(1)
-            # Filter out very short or clearly non-URL strings
-            if len(found_url) > 2 and not found_url.startswith('//'): # Exclude protocol relative URLs and very short ones
-                urls_to_analyze.add(urljoin(self.url, found_url))
-        
-        potential_path_params = set()
-        print("[*] Analyzing URLs for potential path parameters...")
-
-        for url_str in urls_to_analyze:
-            if url_str in self.processed_urls:
-                continue
-            self.processed_urls.add(url_str) # Mark as processed
-
-            parsed_url = urlparse(url_str)
-            path_segments = [s for s in parsed_url.path.split('/') if s] # Split and remove empty strings
-
-            if not path_segments:
-                continue
-
-            for i, segment in enumerate(path_segments):
-                # Heuristic 1: Explicit placeholders (e.g., {id}, :slug)
-                explicit_placeholder_match = re.match(r'[{:]?([a-zA-Z_$][a-zA-Z0-9_$]*)[}]?', segment)
-                if explicit_placeholder_match and explicit_placeholder_match.group(1) != segment: # Ensure it's not just a regular word
-                    potential_path_params.add(explicit_placeholder_match.group(1))
-                    print(f"    [+] Found explicit path placeholder: {explicit_placeholder_match.group(1)} in {url_str}")
-                
-                # Heuristic 2: Numeric IDs (e.g., /users/123, where 123 is the segment)
-                if segment.isdigit() and len(segment) > 1: # Avoid single digits unless context suggests
-                    # If the previous segment is known (e.g., 'users', 'products'),
-                    # we can infer a parameter name. Otherwise, it's just 'id' or 'numeric_param'.
-                    param_name_hint = "id"
-                    if i > 0:
-                        prev_segment = path_segments[i-1].lower()
-                        if prev_segment in ["users", "products", "items", "posts", "orders"]:
-                            param_name_hint = f"{prev_segment}_id"
-                        elif prev_segment.endswith('s'): # plural like "categories"
-                            param_name_hint = f"{prev_segment[:-1]}_id"
-                    
-                    potential_path_params.add(param_name_hint)
-                    print(f"    [+] Found numeric path segment (potential {param_name_hint}): {segment} in {url_str}")
-
-                # Heuristic 3: Common slug patterns (e.g., "my-product-title", "john-doe")
-                # Exclude common fixed path segments like "api", "v1", "css", "js", "img"
-                common_static_segments = {"api", "v1", "v2", "css", "js", "img", "images", "static", "assets", "admin", "dashboard", "new", "edit", "delete", "view", "index", "home"}
-                if (re.match(r'^[a-zA-Z0-9_-]+$', segment) and
-                    not segment.isdigit() and # Already covered by Heuristic 2
-                    len(segment) > 2 and # Avoid very short segments like 'a', 'b'
-                    segment.lower() not in common_static_segments):
-                    
-                    # This is highly heuristic. Could be a file name, or a slug.
-                    # We'll just add "slug" or "name" as a generic placeholder.
-                    param_name_hint = "slug"
-                    if i > 0:
-                        prev_segment = path_segments[i-1].lower()
-                        if prev_segment in ["products", "articles", "posts", "categories", "users"]:
-                            param_name_hint = f"{prev_segment[:-1]}_slug" if prev_segment.endswith('s') else f"{prev_segment}_name"
-                    
-                    potential_path_params.add(param_name_hint)
-                    print(f"    [+] Found alphanumeric/hyphenated path segment (potential {param_name_hint}): {segment} in {url_str}")
-
-        if potential_path_params:
-            print(f"[+] Potential Path/Route Parameters found: {list(potential_path_params)}")
-            self.found_parameters["Potential Path/Route Parameters"].update(potential_path_params)
-        else:
-            print("[-] No potential Path/Route Parameters found from URLs on the page.")
-
-
-    def extract_form_parameters(self):
-        """
-        Extracts parameters from HTML forms (input, select, textarea elements).
-        Separates visible and hidden inputs.
-        """
-        if not self.html_content:
-            return
-
-        soup = BeautifulSoup(self.html_content, 'html.parser')
-        forms = soup.find_all('form')
-        
-        if not forms:
-            print("[-] No forms found on the page.")
-            return
-
-        for i, form in enumerate(forms):
-            print(f"[*] Analyzing Form {i+1} (Action: {form.get('action', 'N/A')}, Method: {form.get('method', 'GET')})")
-            
-            # Find all relevant input elements within the form
-            form_elements = form.find_all(['input', 'select', 'textarea'])
-            
-            for element in form_elements:
-                name = element.get('name')
-                if name:
-                    if element.name == 'input' and element.get('type') == 'hidden':
-                        self.found_parameters["Form Parameters (Hidden)"].add(name)
-                        print(f"    [+] Hidden Form Parameter: {name}")
-                    else:
-                        # Corrected line: removed the extra '()' after "Form Parameters (Visible)"
-                        self.found_parameters["Form Parameters (Visible)"].add(name)
-                        print(f"    [+] Visible Form Parameter: {name} (Type: {element.get('type', 'text') if element.name == 'input' else element.name})")
-
-    def extract_js_parameters(self):
-        """
-        Attempts to extract potential parameters from JavaScript code
-        by looking for common variable assignment patterns or object keys.
-        This is a heuristic approach and may have false positives.
-        """
-        if not self.html_content:
-            return
-
-        soup = BeautifulSoup(self.html_content, 'html.parser')
-        script_tags = soup.find_all('script')
-        
-        if not script_tags:
-            print("[-] No <script> tags found on the page.")
-            return
-
-        js_content = "\n".join([script.string if script.string else '' for script in script_tags])
-
-        # Regex to find variable assignments or object keys that look like parameters
-        # e.g., 'paramName = "value"', 'paramName: "value"', 'name="paramName"'
-        param_patterns = re.findall(r'(?:var|let|const|\bthis\.)\s*([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=|([a-zA-Z_$][a-zA-Z0-9_$]*)\s*:\s*(?:["\']|\d)', js_content)
-        
-        found_in_js = set()
-        for match in param_patterns:
-            if match[0]: # For assignments (var param = ...)
-                found_in_js.add(match[0])
-            if match[1]: # For object keys (param: ...)
-                found_in_js.add(match[1])
-
-        # Also look for 'name=' attributes within script blocks, though less common for JS variables
-        name_attributes_in_js = re.findall(r'name=["\']([a-zA-Z_$][a-zA-Z0-9_$]*)["\']', js_content)
-        for name in name_attributes_in_js:
-            found_in_js.add(name)
-
-        if found_in_js:
-            print(f"[+] Potential JavaScript-like parameters found: {list(found_in_js)}")
-            self.found_parameters["JavaScript-like Parameters"].update(found_in_js)
-        else:
-            print("[-] No JavaScript-like parameters found.")
-
-    def extract_comment_parameters(self):
-        """
-        Extracts potential parameters from HTML comments.
-        """
-        if not self.html_content:
-            return
-
-        soup = BeautifulSoup(self.html_content, 'html.parser')
-        comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-        
-        if not comments:
-            print("[-] No HTML comments found on the page.")
-            return
-
-        found_in_comments = set()
-        for comment in comments:
-            # Look for words that could be parameter names (e.g., 'param_name=value')
-            param_matches = re.findall(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*(?:["\']?[a-zA-Z0-9_.-]+["\']?|\d+)', str(comment))
-            for p in param_matches:
-                found_in_comments.add(p)
-            
-            # Also look for standalone words that might be referenced as parameters
-            words_in_comment = re.findall(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b', str(comment))
-            common_words = {"this", "that", "the", "and", "or", "not", "for", "in", "with", "is", "of", "to", "a", "an", "on", "at", "by", "from", "as", "it", "he", "she", "we", "they", "you", "my", "your", "his", "her", "our", "their", "its", "up", "down", "left", "right", "true", "false", "null", "undefined"} # Expanded filter
-            for word in words_in_comment:
-                if len(word) > 2 and word.lower() not in common_words:
-                    found_in_comments.add(word)
-
-        if found_in_comments:
-            print(f"[+] Potential Comment parameters found: {list(found_in_comments)}")
-            self.found_parameters["Comment Parameters"].update(found_in_comments)
-        else:
-            print("[-] No Comment parameters found.")
-
-    def find_all_parameters(self):
-        """
-        Executes all parameter extraction methods.
-        """
-        self.fetch_page()
-        self.extract_url_query_parameters()
-        self.extract_potential_path_parameters() # New method call
-        self.extract_form_parameters()
-        self.extract_js_parameters()
-        self.extract_comment_parameters()
-        self.display_results()
-
-    def display_results(self):
-        """
-        Prints a summary of all found parameters.
-        """
-        print("\n" + "="*50)
-        print("           Parameter Discovery Results           ")
-        print("="*50)
-        print(f"Target URL: {self.url}\n")
-
-        total_found = 0
-        for category, params_set in self.found_parameters.items():
-            params_list = sorted(list(params_set)) # Sort for consistent output
-            print(f"--- {category} ({len(params_list)} found) ---")
-            if params_list:
-                for param in params_list:
-                    print(f"  - {param}")
-                total_found += len(params_list)
-            else:
-                print("  (None)")
-            print() # Add a newline for spacing between categories
-
-        print("="*50)
-        print(f"Total Unique Parameters Discovered: {total_found}")
-        print("="*50)
-        print("\nNote: Path/Route, JavaScript, and Comment parameters are heuristic and may contain false positives due to static analysis limitations.")
-        print("Consider dynamic analysis (e.g., using Selenium) for a more complete picture, especially for client-side rendered parameters.")
-
-
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python parameter_finder.py <URL>")
-        print("Example: python parameter_finder.py https://example.com/search?q=test")
-        sys.exit(1)
-
-    target_url = sys.argv[1]
-    finder = WebParameterFinder(target_url)
-    finder.find_all_parameters()
-
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+from urllib.parse import urlparse, parse_qs, urljoin
+import logging
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Cap on how much of a response is read, so an accidental hit on a huge asset
+# can't blow up memory or downstream parse time.
+_MAX_CONTENT_BYTES = 5 * 1024 * 1024
+_HTML_CONTENT_TYPES = ('text/html', 'application/xhtml')
+
+# Prefer the C-based lxml parser (5-10x faster than the pure-Python one);
+# fall back gracefully if it isn't installed.
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+# Prefer selectolax (Lexbor backend) for tag extraction: we only need hrefs,
+# form fields, and script text, and it is several times faster than
+# BeautifulSoup even on lxml. BeautifulSoup remains the fallback.
+try:
+    from selectolax.parser import HTMLParser
+    _HAS_SELECTOLAX = True
+except ImportError:
+    _HAS_SELECTOLAX = False
+
+# Pre-compiled patterns shared by the extractors. Compiling once at import
+# time avoids repeated lookups in re's internal cache inside hot loops.
+# Quoted path-like strings in scripts. Requiring a '/' makes clearly-non-URL
+# literals fail at the first character-class mismatch instead of backtracking.
+_JS_URL_RE = re.compile(r'["\'](/[\w\-./]*|[\w\-.]+/[\w\-./]*)["\']')
+# Matches only genuine placeholders ({id} or :slug); plain words fail at the
+# first character, so no post-hoc "did it match the whole segment" check.
+_PLACEHOLDER_RE = re.compile(r'^(?:\{([a-zA-Z_$][a-zA-Z0-9_$]*)\}|:([a-zA-Z_$][a-zA-Z0-9_$]*))$')
+_SLUG_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+# Assignments, object keys, and name= attributes in one alternation so each
+# script chunk is traversed a single time.
+_JS_COMBINED_RE = re.compile(r'(?:var|let|const|\bthis\.)\s*([a-zA-Z_$][a-zA-Z0-9_$]*)\s*=|([a-zA-Z_$][a-zA-Z0-9_$]*)\s*:\s*(?:["\']|\d)|name=["\']([a-zA-Z_$][a-zA-Z0-9_$]*)["\']')
+_WORD_RE = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b')
+_COMMENT_RE = re.compile(r'<!--(.*?)-->', re.DOTALL)
+
+# Stopword sets used by the heuristics, built once and shared. Frozensets are
+# immutable so they are safe to reference from every extraction pass.
+_STATIC_PATH_SEGMENTS = frozenset({"api", "v1", "v2", "css", "js", "img", "images", "static", "assets", "admin", "dashboard", "new", "edit", "delete", "view", "index", "home"})
+# Parameter-name hints keyed by the (lowercased) preceding path segment
+_ID_HINTS = {"users": "users_id", "products": "products_id", "items": "items_id", "posts": "posts_id", "orders": "orders_id"}
+_SLUG_HINTS = {"products": "product_slug", "articles": "article_slug", "posts": "post_slug", "categories": "category_slug", "users": "user_slug"}
+_COMMON_WORDS = frozenset({"this", "that", "the", "and", "or", "not", "for", "in", "with", "is", "of", "to", "a", "an", "on", "at", "by", "from", "as", "it", "he", "she", "we", "they", "you", "my", "your", "his", "her", "our", "their", "its", "up", "down", "left", "right", "true", "false", "null", "undefined"})
+
+
+# Scheme prefix of an absolute URL, e.g. "https://" or "mailto:" variants
+_ABSOLUTE_URL_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.\-]*://')
+
+# The same URL tends to be parsed repeatedly across extractors on link-heavy
+# pages; memoizing urlparse makes repeats a dict hit.
+_urlparse_cached = lru_cache(maxsize=4096)(urlparse)
+
+
+def _fast_join(base, ref):
+    """
+    urljoin with cheap short-circuits: absolute refs are already joined, and
+    fragment/query-only refs never change the path we analyze.
+    """
+    if _ABSOLUTE_URL_RE.match(ref):
+        return ref
+    if ref.startswith(('#', '?')):
+        return base
+    return urljoin(base, ref)
+
+
+class WebParameterFinder:
+    """
+    A class to find public and hidden parameters in a web application's HTML source,
+    including query string, form, JavaScript, comments, and potential path parameters.
+    """
+
+    # Shared session so repeated fetches (e.g. when crawling several URLs)
+    # reuse pooled TCP/TLS connections instead of re-handshaking each time.
+    _session = requests.Session()
+    _session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20))
+    _session.mount('http://', HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+    def __init__(self, url):
+        self.url = url
+        self._base_parsed = urlparse(url)
+        self.html_content = None
+        # Flat page data populated by _parse_page; the extractors consume
+        # these instead of walking a parse tree themselves.
+        self._a_hrefs = []
+        self._form_actions = []
+        self._form_headers = []    # (action, method) per form, for debug logging
+        self._form_fields = []     # (name, tag, type) per named input/select/textarea
+        self._script_texts = []
+        self.found_parameters = {
+            "URL Query Parameters": set(),
+            "Potential Path/Route Parameters": set(),
+            "Form Parameters (Visible)": set(),
+            "Form Parameters (Hidden)": set(),
+            "JavaScript-like Parameters": set(),
+            "Comment Parameters": set(),
+        }
+        self.processed_urls = set() # To avoid redundant processing of URLs
+
+    def fetch_page(self):
+        """
+        Fetches the HTML content of the given URL.
+        """
+        try:
+            logger.info(f"[*] Fetching page: {self.url}")
+            response = self._session.get(self.url, timeout=10, stream=True)
+            response.raise_for_status()  # Raise an HTTPError for bad responses (4xx or 5xx)
+
+            content_type = response.headers.get('content-type', '')
+            if content_type and not content_type.startswith(_HTML_CONTENT_TYPES):
+                logger.error(f"[-] Skipping non-HTML content type '{content_type}' at {self.url}")
+                sys.exit(1)
+            # A hostile or buggy server may send a malformed content-length;
+            # ignore it and rely on the capped read below.
+            content_length = response.headers.get('content-length', '')
+            if content_length.isdigit() and int(content_length) > _MAX_CONTENT_BYTES:
+                logger.error(f"[-] Page exceeds the {_MAX_CONTENT_BYTES} byte limit: {self.url}")
+                sys.exit(1)
+
+            # Read at most the cap even when content-length is absent or lies.
+            # iter_content (unlike response.raw) translates mid-body connection
+            # failures into RequestException, keeping the handler below intact.
+            chunks = []
+            bytes_read = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                bytes_read += len(chunk)
+                if bytes_read >= _MAX_CONTENT_BYTES:
+                    break
+            data = b"".join(chunks)[:_MAX_CONTENT_BYTES]
+            self.html_content = data.decode(response.encoding or 'utf-8', errors='replace')
+            self._parse_page()
+            logger.info("[*] Page fetched successfully.")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"[-] Error fetching page {self.url}: {e}")
+            sys.exit(1) # Exit if we can't fetch the page
+
+    def _parse_page(self):
+        """
+        Parses the fetched HTML once into the flat structures the extractors
+        consume (hrefs, form actions/fields, script text). Parsing is the
+        dominant CPU cost, so it happens exactly once per page, with the
+        fastest available backend.
+        """
+        if _HAS_SELECTOLAX:
+            tree = HTMLParser(self.html_content)
+            self._a_hrefs = [href for node in tree.css('a[href]')
+                             if (href := node.attributes.get('href')) is not None]
+            self._form_actions = [action for node in tree.css('form[action]')
+                                  if (action := node.attributes.get('action')) is not None]
+            self._form_headers = [(node.attributes.get('action'), node.attributes.get('method'))
+                                  for node in tree.css('form')]
+            self._form_fields = [(node.attributes.get('name'), node.tag, node.attributes.get('type'))
+                                 for node in tree.css('form input[name], form select[name], form textarea[name]')]
+            self._script_texts = [text for node in tree.css('script') if (text := node.text())]
+        else:
+            soup = BeautifulSoup(self.html_content, PARSER)
+            self._a_hrefs = [a_tag['href'] for a_tag in soup.find_all('a', href=True)]
+            self._form_actions = [form_tag['action'] for form_tag in soup.find_all('form', action=True)]
+            self._form_headers = [(form.get('action'), form.get('method')) for form in soup.find_all('form')]
+            self._form_fields = [(el.get('name'), el.name, el.get('type'))
+                                 for el in soup.select('form input[name], form select[name], form textarea[name]')]
+            self._script_texts = [text for script in soup.find_all('script') if (text := script.string)]
+
+    @classmethod
+    def close(cls):
+        """
+        Closes the shared HTTP session and releases its connection pool.
+        """
+        cls._session.close()
+
+    def extract_url_query_parameters(self):
+        """
+        Extracts parameters directly from the URL's query string.
+        """
+        query_params = parse_qs(self._base_parsed.query)
+        for param_name in query_params.keys():
+            self.found_parameters["URL Query Parameters"].add(param_name)
+        if query_params:
+            logger.info(f"[+] Found URL Query Parameters: {list(query_params.keys())}")
+        else:
+            logger.info("[-] No URL Query Parameters found in the initial URL.")
+
+    def extract_potential_path_parameters(self):
+        """
+        Extracts potential path/route parameters by analyzing URLs found in the HTML.
+        This uses heuristics to identify dynamic segments or explicit placeholders.
+        """
+        if not self.html_content:
+            return
+
+        # Collect raw refs first; deduplicating plain strings is much cheaper
+        # than joining, so each unique ref is resolved exactly once below.
+        raw_refs = set()
+
+        # From <a> tags
+        raw_refs.update(self._a_hrefs)
+
+        # From <form> tags
+        raw_refs.update(self._form_actions)
+
+        # From <script> tags (look for URL-like strings)
+        # A more general regex for URLs in scripts, including relative paths
+        # This is a broad net and might catch non-URL strings.
+        for chunk in self._script_texts:
+            for match in _JS_URL_RE.finditer(chunk):
+                found_url = match.group(1)
+                # Filter out very short or clearly non-URL strings
+                if len(found_url) > 2 and not found_url.startswith('//'): # Exclude protocol relative URLs and very short ones
+                    raw_refs.add(found_url)
+
+        urls_to_analyze = {_fast_join(self.url, ref) for ref in raw_refs} # Resolve relative URLs
+
+        potential_path_params = set()
+        seen_paths = set() # Same path with different query strings yields identical segments
+        logger.info("[*] Analyzing URLs for potential path parameters...")
+
+        for url_str in urls_to_analyze:
+            if url_str in self.processed_urls:
+                continue
+            self.processed_urls.add(url_str) # Mark as processed
+
+            parsed_url = _urlparse_cached(url_str)
+            path_segments = [s for s in parsed_url.path.split('/') if s] # Split and remove empty strings
+
+            if not path_segments:
+                continue
+
+            path_key = tuple(path_segments)
+            if path_key in seen_paths:
+                continue
+            seen_paths.add(path_key)
+
+            lowered = [s.lower() for s in path_segments] # Lowercase once per URL
+
+            for i, segment in enumerate(path_segments):
+                # Cheapest checks gate the regex calls: isdigit/len/set membership
+                # are far cheaper than a regex match, so run them first.
+                prev_lower = lowered[i-1] if i > 0 else None
+
+                # Heuristic 2: Numeric IDs (e.g., /users/123, where 123 is the segment)
+                if segment.isdigit():
+                    if len(segment) > 1: # Avoid single digits unless context suggests
+                        # If the previous segment is known (e.g., 'users', 'products'),
+                        # we can infer a parameter name. Otherwise, it's just 'id' or 'numeric_param'.
+                        param_name_hint = "id"
+                        if prev_lower:
+                            param_name_hint = _ID_HINTS.get(prev_lower) or (f"{prev_lower[:-1]}_id" if prev_lower.endswith('s') else "id")
+
+                        potential_path_params.add(param_name_hint)
+                        logger.debug(f"    [+] Found numeric path segment (potential {param_name_hint}): {segment} in {url_str}")
+                    continue # Digit-only segments can't match the remaining heuristics
+
+                # Skip very short segments and common fixed ones like "api", "css", "js"
+                if len(segment) <= 2 or lowered[i] in _STATIC_PATH_SEGMENTS:
+                    continue
+
+                # Heuristic 1: Explicit placeholders (e.g., {id}, :slug)
+                explicit_placeholder_match = _PLACEHOLDER_RE.match(segment)
+                if explicit_placeholder_match:
+                    placeholder_name = explicit_placeholder_match.group(1) or explicit_placeholder_match.group(2)
+                    potential_path_params.add(placeholder_name)
+                    logger.debug(f"    [+] Found explicit path placeholder: {placeholder_name} in {url_str}")
+
+                # Heuristic 3: Common slug patterns (e.g., "my-product-title", "john-doe")
+                if _SLUG_RE.match(segment):
+                    # This is highly heuristic. Could be a file name, or a slug.
+                    # We'll just add "slug" or "name" as a generic placeholder.
+                    param_name_hint = _SLUG_HINTS.get(prev_lower, "slug") if prev_lower else "slug"
+
+                    potential_path_params.add(param_name_hint)
+                    logger.debug(f"    [+] Found alphanumeric/hyphenated path segment (potential {param_name_hint}): {segment} in {url_str}")
+
+        if potential_path_params:
+            logger.info(f"[+] Potential Path/Route Parameters found: {list(potential_path_params)}")
+            self.found_parameters["Potential Path/Route Parameters"].update(potential_path_params)
+        else:
+            logger.info("[-] No potential Path/Route Parameters found from URLs on the page.")
+
+
+    def extract_form_parameters(self):
+        """
+        Extracts parameters from HTML forms (input, select, textarea elements).
+        Separates visible and hidden inputs.
+        """
+        if not self.html_content:
+            return
+
+        if not self._form_headers:
+            logger.info("[-] No forms found on the page.")
+            return
+
+        for i, (action, method) in enumerate(self._form_headers):
+            logger.debug(f"[*] Analyzing Form {i+1} (Action: {action if action is not None else 'N/A'}, Method: {method if method is not None else 'GET'})")
+
+        for name, tag, input_type in self._form_fields:
+            if tag == 'input' and input_type == 'hidden':
+                self.found_parameters["Form Parameters (Hidden)"].add(name)
+                logger.debug(f"    [+] Hidden Form Parameter: {name}")
+            else:
+                self.found_parameters["Form Parameters (Visible)"].add(name)
+                logger.debug(f"    [+] Visible Form Parameter: {name} (Type: {(input_type if input_type is not None else 'text') if tag == 'input' else tag})")
+
+    def extract_js_parameters(self):
+        """
+        Attempts to extract potential parameters from JavaScript code
+        by looking for common variable assignment patterns or object keys.
+        This is a heuristic approach and may have false positives.
+        """
+        if not self.html_content:
+            return
+
+        if not self._script_texts:
+            logger.info("[-] No <script> tags found on the page.")
+            return
+
+        found_in_js = set()
+        for chunk in self._script_texts:
+            # One pass per chunk finds assignments (var param = ...), object
+            # keys (param: ...), and name="param" attributes alike.
+            for match in _JS_COMBINED_RE.finditer(chunk):
+                for group in match.groups():
+                    if group:
+                        found_in_js.add(group)
+                        break
+
+        if found_in_js:
+            logger.info(f"[+] Potential JavaScript-like parameters found: {list(found_in_js)}")
+            self.found_parameters["JavaScript-like Parameters"].update(found_in_js)
+        else:
+            logger.info("[-] No JavaScript-like parameters found.")
+
+    def extract_comment_parameters(self):
+        """
+        Extracts potential parameters from HTML comments.
+        """
+        if not self.html_content:
+            return
+
+        # A one-shot regex over the raw HTML finds comments without walking
+        # every text node of a parse tree and calling a predicate per node.
+        comments = [match.group(1) for match in _COMMENT_RE.finditer(self.html_content)]
+        
+        if not comments:
+            logger.info("[-] No HTML comments found on the page.")
+            return
+
+        found_in_comments = set()
+        for comment in comments:
+            # A single word scan covers both 'param_name=value' pairs and
+            # standalone words; common/short words are filtered in Python.
+            for match in _WORD_RE.finditer(comment):
+                word = match.group(1)
+                if len(word) > 2 and word.lower() not in _COMMON_WORDS:
+                    found_in_comments.add(word)
+
+        if found_in_comments:
+            logger.info(f"[+] Potential Comment parameters found: {list(found_in_comments)}")
+            self.found_parameters["Comment Parameters"].update(found_in_comments)
+        else:
+            logger.info("[-] No Comment parameters found.")
+
+    def find_all_parameters(self):
+        """
+        Executes all parameter extraction methods. The extractors are
+        independent (read-only over the parsed page, each writing to its own
+        result set), so they run in parallel; the regex and parsing work they
+        do releases the GIL.
+        """
+        self.fetch_page()
+        extractors = [
+            self.extract_url_query_parameters,
+            self.extract_potential_path_parameters,
+            self.extract_form_parameters,
+            self.extract_js_parameters,
+            self.extract_comment_parameters,
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # Logging handlers serialize per line, so parallel extractors
+            # can't garble each other's output.
+            list(executor.map(lambda extractor: extractor(), extractors))
+        self.display_results()
+
+    def display_results(self):
+        """
+        Prints a summary of all found parameters.
+        """
+        print("\n" + "="*50)
+        print("           Parameter Discovery Results           ")
+        print("="*50)
+        print(f"Target URL: {self.url}\n")
+
+        total_found = 0
+        for category, params_set in self.found_parameters.items():
+            params_list = sorted(params_set) # Sort for consistent output
+            print(f"--- {category} ({len(params_list)} found) ---")
+            if params_list:
+                # One write per category instead of one per parameter
+                print("\n".join(f"  - {param}" for param in params_list))
+                total_found += len(params_list)
+            else:
+                print("  (None)")
+            print() # Add a newline for spacing between categories
+
+        print("="*50)
+        print(f"Total Unique Parameters Discovered: {total_found}")
+        print("="*50)
+        print("\nNote: Path/Route, JavaScript, and Comment parameters are heuristic and may contain false positives due to static analysis limitations.")
+        print("Consider dynamic analysis (e.g., using Selenium) for a more complete picture, especially for client-side rendered parameters.")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    verbose = "--verbose" in args or "-v" in args
+    args = [a for a in args if a not in ("--verbose", "-v")]
+
+    if not args:
+        print("Usage: python parameter_finder.py <URL> [--verbose]")
+        print("Example: python parameter_finder.py https://example.com/search?q=test")
+        sys.exit(1)
+
+    # Per-hit messages log at DEBUG and only format/write when --verbose is
+    # set; by default the hot loops skip the I/O entirely.
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
+
+    target_url = args[0]
+    finder = WebParameterFinder(target_url)
+    finder.find_all_parameters()
+